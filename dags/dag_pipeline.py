@@ -1,9 +1,18 @@
-from airflow.sdk import dag, task  # Fixed: Changed from airflow.decorators
+from airflow.sdk import dag, task, Param  # Fixed: Changed from airflow.decorators
 from datetime import datetime, timedelta
 from airflow import settings 
+from helpers.intervals import (
+    SEED_INTERVAL_COLUMNS, bootstrap_tables, dbt_interval_options, dbt_run_target_path, dbt_runs_dir,
+    interval_predicate, prune_run_target_paths, run_interval, slice_interval)
 
 
 DBT_ROOT_DIR = f"{settings.DAGS_FOLDER}/ecommerce_dbt"
+
+# Each run only touches its data interval (scheduled runs: everything since the last successful
+# interval_end). Scheduled/manual runs stay serialized because they rebuild the full_history models;
+# backfills fan out with `airflow backfill create --max-active-runs N`. The first run ever loads all of
+# history and creates the tables; params {"full_history": true} forces that again.
+
 @dag(
     dag_id="ecommerce_dag_pipeline",
     default_args={
@@ -12,29 +21,52 @@ DBT_ROOT_DIR = f"{settings.DAGS_FOLDER}/ecommerce_dbt"
         'retries': 2,
         'retry_delay': timedelta(seconds=15)
     },
-    schedule=timedelta(hours=6), 
-    start_date=datetime(2025, 12, 29),
+    schedule=timedelta(days=1), 
+    start_date=datetime(2024, 1, 1),
     catchup=False, 
     tags=['dbt','medallion','ecommerce','analytics'],
-    max_active_runs=1
+    max_active_runs=1,
+    params={
+        'full_history': Param(False, type='boolean',
+                              description='Ignore the data interval and reload all of history')
+    }
 )
 
 
 def dag_pipeline():
     @task
-    def start_pipeline():
+    def start_pipeline(data_interval_start=None, data_interval_end=None, prev_data_interval_end_success=None,
+                       dag_run=None, params=None):
         import logging
+        from airflow.utils.types import DagRunType
         logger =logging.getLogger(__name__)
         logger.info("Starting pipeline")
 
+        pruned = prune_run_target_paths(dbt_runs_dir(DBT_ROOT_DIR))
+        if pruned:
+            logger.info(f"Pruned {len(pruned)} expired dbt run target directories")
+
+        is_backfill = dag_run is not None and dag_run.run_type == DagRunType.BACKFILL_JOB
+        interval_start, interval_end = run_interval(
+            data_interval_start, data_interval_end, prev_data_interval_end_success,
+            is_backfill=is_backfill, full_history=bool(params and params.get('full_history')))
+        if interval_start is not None:
+            pipeline_id = f'dag_pipeline_{interval_start.replace("-", "").replace(":", "").replace(" ", "T")}'
+        else:
+            pipeline_id = f'dag_pipeline_{datetime.now().strftime("%Y%m%dT%H%M%S")}'
+
         pipeline_metadata = {
             'pipeline_start_time': datetime.now().isoformat(),
             'dbt_root_dir': DBT_ROOT_DIR,
-            'pipeline_id': f'dag_pipeline_{datetime.now().strftime("%Y%m%dT%H%M%S")}',
-            'environment': 'production'
+            'pipeline_id': pipeline_id,
+            'environment': 'production',
+            'interval_start': interval_start,
+            'interval_end': interval_end,
+            'is_backfill': is_backfill
         }
 
-        logger.info(f"starting pipeline with ID: {pipeline_metadata['pipeline_id']}")
+        logger.info(f"starting pipeline with ID: {pipeline_metadata['pipeline_id']} "
+                    f"for interval [{interval_start}, {interval_end})")
 
         return pipeline_metadata
     
@@ -48,6 +80,9 @@ def dag_pipeline():
         logger = logging.getLogger(__name__)
         logger.info("Seeding Bronze layer - Optimized bulk INSERT method")
 
+        interval_start = pipeline_metadata['interval_start']
+        interval_end = pipeline_metadata['interval_end']
+
         seed_files = {
             'customer_events': f'{DBT_ROOT_DIR}/seeds/customer_events.csv',
             'inventory_snapshots': f'{DBT_ROOT_DIR}/seeds/inventory_snapshots.csv',
@@ -55,20 +90,26 @@ def dag_pipeline():
             'support_tickets': f'{DBT_ROOT_DIR}/seeds/support_tickets.csv'
         }
 
+        engine = sqlalchemy.create_engine('trino://trino@trino-coordinator:8080/iceberg/bronze')
+
+        if pipeline_metadata['is_backfill']:
+            with engine.connect() as conn:
+                existing_tables = {row[0] for row in conn.execute(text(
+                    "SELECT table_name FROM iceberg.information_schema.tables WHERE table_schema = 'bronze'"))}
+            missing_tables = [name for name in bootstrap_tables() if name not in existing_tables]
+            if missing_tables:
+                raise Exception(f"Backfill requires bronze tables {missing_tables}; "
+                                f"trigger a run with full_history=true first")
+
         try:
-            engine = sqlalchemy.create_engine('trino://trino@trino-coordinator:8080/iceberg/bronze')
-            
             for table_name, csv_path in seed_files.items():
                 logger.info(f"Processing {table_name} from {csv_path}")
+                interval_column, interval_column_format = SEED_INTERVAL_COLUMNS[table_name]
                 
-                # Drop existing table
-                with engine.begin() as conn:
-                    logger.info(f"Dropping table bronze.{table_name} if exists")
-                    conn.execute(text(f"DROP TABLE IF EXISTS bronze.{table_name}"))
-                
-                # Read CSV with Polars (FAST)
-                df = pl.read_csv(csv_path)
-                logger.info(f"Read {len(df)} rows from {csv_path}")
+                # Scan CSV with Polars (FAST) and keep only this run's interval
+                df = slice_interval(pl.scan_csv(csv_path), interval_column, interval_column_format,
+                                    interval_start, interval_end).collect()
+                logger.info(f"Read {len(df)} rows for [{interval_start}, {interval_end}) from {csv_path}")
                 
                 # Get column definitions
                 columns_def = []
@@ -90,14 +131,22 @@ def dag_pipeline():
                 # Create table without explicit location to avoid conflicts
                 with engine.begin() as conn:
                     create_sql = f"""
-                        CREATE TABLE bronze.{table_name} (
+                        CREATE TABLE IF NOT EXISTS bronze.{table_name} (
                             {', '.join(columns_def)}
                         )
-                        WITH (format = 'PARQUET')
+                        WITH (format = 'PARQUET', partitioning = ARRAY['day({interval_column})'])
                     """
-                    logger.info(f"Creating table")
+                    logger.info(f"Creating table if not exists")
                     conn.execute(text(create_sql))
                 
+                # Overwrite only this interval's day partitions, leaving other runs' partitions untouched
+                with engine.begin() as conn:
+                    logger.info(f"Deleting interval [{interval_start}, {interval_end}) from bronze.{table_name}")
+                    conn.execute(text(
+                        f"DELETE FROM bronze.{table_name} "
+                        f"WHERE {interval_predicate(interval_column, interval_start, interval_end)}"
+                    ))
+                
                 # Insert data in large batches (5000 rows per batch for speed)
                 batch_size = 5000
                 total_rows = len(df)
@@ -121,6 +170,8 @@ def dag_pipeline():
                                     values.append(str(val))
                                 elif isinstance(val, bool):
                                     values.append('true' if val else 'false')
+                                elif isinstance(val, datetime):
+                                    values.append(f"TIMESTAMP '{val}'")
                                 else:
                                     values.append(f"'{str(val)}'")
                             values_list.append(f"({', '.join(values)})")
@@ -149,30 +200,23 @@ def dag_pipeline():
             logger.error(f"Error seeding bronze layer: {e}")
             import traceback
             logger.error(traceback.format_exc())
-            return {
-                'status': 'failed',
-                'layer': 'bronze_seed',
-                'pipeline_id': pipeline_metadata['pipeline_id'],
-                'timestamp': datetime.now().isoformat(),
-                'warning': str(e)}
+            # The slice may already be deleted; fail so Airflow retries the idempotent reload
+            raise
 
     @task
-    def transform_bronze_layer(seed_result):
+    def transform_bronze_layer(seed_result, pipeline_metadata):
         import logging
         from operators.dbt_operator import DbtOperator
         from airflow import settings
 
         logger = logging.getLogger(__name__)
-        if seed_result['status'] == 'failed':
-            logger.warning(f"Seeding failed, continuing with bronze transformation..."
-                           f"{seed_result.get('warning','Unknown error')}")
-            
         logger.info("Transforming Bronze Layer ..")
 
         operator = DbtOperator(
             task_id='transform_bronze_layer_internally',
             dbt_root_dir = DBT_ROOT_DIR,
-            dbt_command='run --select tag:bronze'
+            dbt_command='run --select tag:bronze',
+            **dbt_interval_options(pipeline_metadata, DBT_ROOT_DIR)
         )
 
         try :
@@ -209,7 +253,7 @@ def dag_pipeline():
         }
     
     @task
-    def transform_silver_layer(bronze_validation):
+    def transform_silver_layer(bronze_validation, pipeline_metadata):
         import logging
         from operators.dbt_operator import DbtOperator
         from airflow import settings
@@ -226,7 +270,8 @@ def dag_pipeline():
         operator = DbtOperator(
             task_id='transform_silver_layer_internally',
             dbt_root_dir = DBT_ROOT_DIR,
-            dbt_command='run --select tag:silver'
+            dbt_command='run --select tag:silver',
+            **dbt_interval_options(pipeline_metadata, DBT_ROOT_DIR)
         )
 
         try :
@@ -261,7 +306,7 @@ def dag_pipeline():
             'validation_checks': validation_checks }
     
     @task
-    def transform_gold_layer(silver_validation):
+    def transform_gold_layer(silver_validation, pipeline_metadata):
         import logging
         from operators.dbt_operator import DbtOperator
         from airflow import settings
@@ -278,7 +323,8 @@ def dag_pipeline():
         operator = DbtOperator(
             task_id='transform_gold_layer_internally',
             dbt_root_dir = DBT_ROOT_DIR,
-            dbt_command='run --select tag:gold'
+            dbt_command='run --select tag:gold',
+            **dbt_interval_options(pipeline_metadata, DBT_ROOT_DIR)
         )
 
         try :
@@ -313,7 +359,7 @@ def dag_pipeline():
             'validation_checks': validation_checks }
     
     @task
-    def generate_documentation(gold_validation):
+    def generate_documentation(gold_validation, pipeline_metadata):
         import logging
         from operators.dbt_operator import DbtOperator
 
@@ -322,6 +368,15 @@ def dag_pipeline():
         if gold_validation['status'] != 'success':
             raise Exception(f"Gold validation failed. cannot poceed with documentation generation: {gold_validation}")
         
+        if pipeline_metadata['is_backfill']:
+            logger.info(f"Skipping documentation for backfill pipeline {gold_validation['pipeline_id']}")
+            return {
+                'status': 'skipped',
+                'layer': 'documentation_generation',
+                'pipeline_id': gold_validation['pipeline_id'],
+                'timestamp': datetime.now().isoformat()
+            }
+
         logger.info(f"Generating documentation for pipeline {gold_validation['pipeline_id']} ..")
 
         operator = DbtOperator(
@@ -342,25 +397,29 @@ def dag_pipeline():
             raise
     
     @task
-    def end_pipeline(docs_result ,gold_validation):
+    def end_pipeline(docs_result ,gold_validation, pipeline_metadata):
         import logging
+        import shutil
         logger = logging.getLogger(__name__)
         logger.info("Pipeline completed.")
         logger.info(f"pipeline completed successfully for ID: {gold_validation['pipeline_id']} at {datetime.now().isoformat()}")
         
-        if docs_result['status'] != 'success':
+        if docs_result['status'] not in ('success', 'skipped'):
             logger.warning(f"Documentation generation failed: {docs_result.get('warning','Unknown error')}")
+
+        # Per-run dbt artifacts are only kept for failed runs, to debug them
+        shutil.rmtree(dbt_run_target_path(DBT_ROOT_DIR, pipeline_metadata), ignore_errors=True)
         
 
     pipeline_metadata = start_pipeline()
     seed_result = seed_bronze(pipeline_metadata)
-    bronze_result = transform_bronze_layer(seed_result)
+    bronze_result = transform_bronze_layer(seed_result, pipeline_metadata)
     bronze_validation = validate_bronze_data(bronze_result)
-    silver_result = transform_silver_layer(bronze_validation)
+    silver_result = transform_silver_layer(bronze_validation, pipeline_metadata)
     silver_validation = validate_silver_data(silver_result)
-    gold_result = transform_gold_layer(silver_validation)
+    gold_result = transform_gold_layer(silver_validation, pipeline_metadata)
     gold_validation = validate_gold_data(gold_result)
-    docs_result = generate_documentation(gold_validation)
-    end_pipeline(docs_result, gold_validation)    
+    docs_result = generate_documentation(gold_validation, pipeline_metadata)
+    end_pipeline(docs_result, gold_validation, pipeline_metadata)    
 
 dag = dag_pipeline()
\ No newline at end of file
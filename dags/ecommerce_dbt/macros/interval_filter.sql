@@ -0,0 +1,26 @@
+{% macro interval_filter(column_name) -%}
+    {#- Restricts a model to the Airflow data interval passed in via --vars; full history otherwise -#}
+    {%- set interval_start = var('interval_start', none) -%}
+    {%- set interval_end = var('interval_end', none) -%}
+    {%- if interval_start is not none and interval_end is not none -%}
+        {{ column_name }} >= TIMESTAMP '{{ interval_start }}' AND {{ column_name }} < TIMESTAMP '{{ interval_end }}'
+    {%- else -%}
+        TRUE
+    {%- endif -%}
+{%- endmacro %}
+
+{% macro delete_interval(column_name) -%}
+    {#- pre_hook for interval models: clear the slice about to be re-inserted so reruns stay idempotent -#}
+    {%- if is_incremental() -%}
+        DELETE FROM {{ this }} WHERE {{ interval_filter(column_name) }}
+    {%- endif -%}
+{%- endmacro %}
+
+{% macro trino__make_temp_relation(base_relation, suffix='__dbt_tmp') -%}
+    {#- Interval runs get their own __dbt_tmp relation so overlapping backfills don't swap each other's slice -#}
+    {%- set interval_start = var('interval_start', none) -%}
+    {%- if interval_start is not none -%}
+        {%- set suffix = suffix ~ '_' ~ (interval_start | replace('-', '') | replace(':', '') | replace(' ', '_')) -%}
+    {%- endif -%}
+    {{ return(default__make_temp_relation(base_relation, suffix)) }}
+{%- endmacro %}
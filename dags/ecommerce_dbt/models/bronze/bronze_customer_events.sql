@@ -1,4 +1,10 @@
-{{config(materialized='table',tags=['bronze'])}}
+{{ config(
+    materialized='incremental',
+    incremental_strategy='append',
+    properties={"partitioning": "ARRAY['day(event_timestamp)']"},
+    pre_hook="{{ delete_interval('event_timestamp') }}",
+    tags=['bronze']
+) }}
 
 SELECT
     event_id,
@@ -16,6 +22,7 @@ SELECT
     CURRENT_TIMESTAMP AS ingested_at,
     'customer_events' AS source_system
 FROM {{ ref('customer_events') }}
+WHERE {{ interval_filter('event_timestamp') }}
 --WHERE event_id IS NOT NULL
     --AND customer_id IS NOT NULL
     --AND event_timestamp IS NOT NULL
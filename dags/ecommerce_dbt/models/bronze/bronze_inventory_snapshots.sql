@@ -1,4 +1,10 @@
-{{ config(materialized='table', tags=['bronze']) }}
+{{ config(
+    materialized='incremental',
+    incremental_strategy='append',
+    properties={"partitioning": "ARRAY['day(snapshot_date)']"},
+    pre_hook="{{ delete_interval('snapshot_date') }}",
+    tags=['bronze']
+) }}
 
 SELECT
     snapshot_id,
@@ -16,6 +22,7 @@ SELECT
     CURRENT_TIMESTAMP AS ingested_at,
     'inventory_snapshots' AS source_system
 FROM {{ ref('inventory_snapshots') }}
+WHERE {{ interval_filter('snapshot_date') }}
 --WHERE snapshot_id IS NOT NULL
     --AND product_id IS NOT NULL
     --AND snapshot_date IS NOT NULL
\ No newline at end of file
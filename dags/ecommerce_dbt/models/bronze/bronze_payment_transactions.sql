@@ -1,4 +1,10 @@
-{{ config(materialized='table', tags=['bronze']) }}
+{{ config(
+    materialized='incremental',
+    incremental_strategy='append',
+    properties={"partitioning": "ARRAY['day(transaction_timestamp)']"},
+    pre_hook="{{ delete_interval('transaction_timestamp') }}",
+    tags=['bronze']
+) }}
 
 SELECT
     transaction_id,
@@ -17,6 +23,7 @@ SELECT
     CURRENT_TIMESTAMP AS ingested_at,
     'payment_transactions' AS source_system
 FROM {{ ref('payment_transactions') }}
+WHERE {{ interval_filter('transaction_timestamp') }}
 --WHERE transaction_id IS NOT NULL
     --AND order_id IS NOT NULL
     --AND transaction_timestamp IS NOT NULL
\ No newline at end of file
@@ -1,4 +1,10 @@
-{{ config(materialized='table', tags=['bronze']) }}
+{{ config(
+    materialized='incremental',
+    incremental_strategy='append',
+    properties={"partitioning": "ARRAY['day(created_timestamp)']"},
+    pre_hook="{{ delete_interval('created_timestamp') }}",
+    tags=['bronze']
+) }}
 
 SELECT
     ticket_id,
@@ -21,6 +27,7 @@ SELECT
     CURRENT_TIMESTAMP AS ingested_at,
     'support_tickets' AS source_system
 FROM {{ ref('support_tickets') }}
+WHERE {{ interval_filter('created_timestamp') }}
 --WHERE ticket_id IS NOT NULL
     --AND customer_id IS NOT NULL
     --AND created_timestamp IS NOT NULL
@@ -1,4 +1,4 @@
-{{config(materialized='table', tags=['gold'])}}
+{{config(materialized='table', tags=['gold', 'full_history'])}}
 
 SELECT 
     cs.customer_id,
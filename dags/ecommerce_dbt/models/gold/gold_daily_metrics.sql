@@ -1,4 +1,4 @@
-{{ config(materialized='table', tags=['gold']) }}
+{{ config(materialized='table', tags=['gold', 'full_history']) }}
 
 WITH daily_sessions AS (
     SELECT
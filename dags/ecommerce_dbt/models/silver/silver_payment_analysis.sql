@@ -1,4 +1,4 @@
-{{ config(materialized='table', tags=['silver']) }}
+{{ config(materialized='table', tags=['silver', 'full_history']) }}
 
 WITH payment_enriched AS (
 
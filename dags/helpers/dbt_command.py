@@ -0,0 +1,36 @@
+import json
+
+
+def build_dbt_command_args(dbt_command, dbt_root_dir, target=None, select=None, exclude=None,
+                           target_path=None, full_refresh=False, dbt_vars=None):
+    if isinstance(dbt_command, str):
+        command_parts = dbt_command.split()
+    else:
+        command_parts = [dbt_command]
+    
+    command_args = command_parts + [
+        '--project-dir', dbt_root_dir,
+        '--profiles-dir', dbt_root_dir,
+    ]
+
+    if target:
+        command_args += ['--target', target]
+    
+    if select:
+        command_args += ['--select', select]
+
+    if exclude:
+        command_args += ['--exclude', exclude]
+
+    if target_path:
+        command_args += ['--target-path', target_path]
+
+    if full_refresh:
+        command_args.append('--full-refresh')
+    
+    if dbt_vars:
+        # JSON is valid YAML, so values containing ':' or spaces (timestamps) survive parsing
+        vars_string = json.dumps(dbt_vars)
+        command_args.extend(['--vars', vars_string])
+
+    return command_args
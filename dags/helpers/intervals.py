@@ -0,0 +1,102 @@
+import os
+import shutil
+import time
+from datetime import datetime, timezone
+
+INTERVAL_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Per-run dbt target directories older than this are pruned, whether or not the run succeeded
+RUN_TARGET_RETENTION_DAYS = 3
+
+# Event-time column of each seed table and its CSV format, used to slice rows
+# and partition the Iceberg table by day. The DAG runs daily, so an interval always covers
+# whole day partitions and its DELETE drops them instead of writing position-delete files.
+SEED_INTERVAL_COLUMNS = {
+    'customer_events': ('event_timestamp', '%Y-%m-%d %H:%M:%S'),
+    'inventory_snapshots': ('snapshot_date', '%Y-%m-%d'),
+    'payment_transactions': ('transaction_timestamp', '%Y-%m-%d %H:%M:%S'),
+    'support_tickets': ('created_timestamp', '%Y-%m-%d %H:%M:%S')
+}
+
+# Models needing all of history (sessions, per-customer/agent/product rollups, latest state)
+# carry this tag. Scheduled runs rebuild them; backfill runs skip them, since overlapping
+# rebuilds of the same table would race.
+FULL_HISTORY_TAG = 'full_history'
+
+
+def run_interval(data_interval_start, data_interval_end, prev_data_interval_end_success=None,
+                 is_backfill=False, full_history=False):
+    # Returns the (start, end) slice a run must load as INTERVAL_FORMAT strings, or (None, None)
+    # for all of history. Scheduled/manual runs start from the last successful interval_end, so
+    # intervals skipped while the DAG was paused or the scheduler was down are still loaded.
+    if full_history or data_interval_start is None or data_interval_end is None:
+        return None, None
+    if is_backfill:
+        start = data_interval_start
+    elif prev_data_interval_end_success is None:
+        # First run ever: nothing has been loaded yet
+        return None, None
+    else:
+        start = min(prev_data_interval_end_success, data_interval_start)
+    return (start.astimezone(timezone.utc).strftime(INTERVAL_FORMAT),
+            data_interval_end.astimezone(timezone.utc).strftime(INTERVAL_FORMAT))
+
+
+def slice_interval(lf, column, column_format, interval_start, interval_end):
+    # Parses the seed's event-time column and keeps the half-open [start, end) slice
+    import polars as pl
+
+    lf = lf.with_columns(pl.col(column).str.to_datetime(format=column_format))
+    if interval_start is None or interval_end is None:
+        return lf
+    return lf.filter(pl.col(column).is_between(
+        datetime.strptime(interval_start, INTERVAL_FORMAT),
+        datetime.strptime(interval_end, INTERVAL_FORMAT),
+        closed='left'))
+
+
+def interval_predicate(column, interval_start, interval_end):
+    if interval_start is None or interval_end is None:
+        return 'TRUE'
+    return (f"\"{column}\" >= TIMESTAMP '{interval_start}' "
+            f"AND \"{column}\" < TIMESTAMP '{interval_end}'")
+
+
+def bootstrap_tables():
+    # Tables a full-history run must create before interval runs may fan out:
+    # concurrent first builds would each create the table and only one slice would survive
+    return sorted(list(SEED_INTERVAL_COLUMNS) + [f'bronze_{name}' for name in SEED_INTERVAL_COLUMNS])
+
+
+def dbt_runs_dir(dbt_root_dir):
+    return f"{dbt_root_dir}/target/runs"
+
+
+def dbt_run_target_path(dbt_root_dir, pipeline_metadata):
+    return f"{dbt_runs_dir(dbt_root_dir)}/{pipeline_metadata['pipeline_id']}"
+
+
+def prune_run_target_paths(runs_dir, retention_days=RUN_TARGET_RETENTION_DAYS, now=None):
+    # Failed runs keep their dbt artifacts for debugging; drop them once past retention
+    if not os.path.isdir(runs_dir):
+        return []
+    cutoff = (now if now is not None else time.time()) - retention_days * 86400
+    pruned = []
+    for entry in os.scandir(runs_dir):
+        if entry.is_dir() and entry.stat().st_mtime < cutoff:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            pruned.append(entry.name)
+    return sorted(pruned)
+
+
+def dbt_interval_options(pipeline_metadata, dbt_root_dir):
+    # Overlapping dbt invocations must not share target/ (manifest, run_results, compiled SQL)
+    options = {'target_path': dbt_run_target_path(dbt_root_dir, pipeline_metadata)}
+    if pipeline_metadata['interval_start'] is not None:
+        options['dbt_vars'] = {
+            'interval_start': pipeline_metadata['interval_start'],
+            'interval_end': pipeline_metadata['interval_end']
+        }
+    if pipeline_metadata['is_backfill']:
+        options['exclude'] = f'tag:{FULL_HISTORY_TAG}'
+    return options
@@ -4,6 +4,7 @@ from dbt.cli.main import dbtRunner,dbtRunnerResult
 import os
 from airflow.utils.context import Context
 from typing import Any, Optional, Dict
+from helpers.dbt_command import build_dbt_command_args
 
 
 class DbtOperator(BaseOperator):
@@ -13,6 +14,8 @@ class DbtOperator(BaseOperator):
             dbt_command: str,
             target :str = None,
             select: str = None,
+            exclude: str = None,
+            target_path: str = None,
             dbt_vars: dict = None,
             full_refresh: bool = False,
             **kwargs,) :
@@ -22,10 +25,24 @@ class DbtOperator(BaseOperator):
         self.dbt_command = dbt_command
         self.target = target
         self.select = select
+        self.exclude = exclude
+        self.target_path = target_path
         self.dbt_vars = dbt_vars 
         self.full_refresh = full_refresh
         self.runner = dbtRunner()
     
+    def build_command_args(self) -> list:
+        return build_dbt_command_args(
+            self.dbt_command,
+            self.dbt_root_dir,
+            target=self.target,
+            select=self.select,
+            exclude=self.exclude,
+            target_path=self.target_path,
+            full_refresh=self.full_refresh,
+            dbt_vars=self.dbt_vars,
+        )
+
     def execute(self, context: Context) -> Any :
 
         if not os.path.exists(self.dbt_root_dir):  # Fixed: exist -> exists
@@ -48,29 +65,7 @@ class DbtOperator(BaseOperator):
                 self.log.error(f"Failed to set write permissions for logs directory at {logs_dir}: {e}")
                 raise AirflowException(f"Failed to set write permissions for logs directory at {logs_dir}: {e}")
         
-        if isinstance(self.dbt_command, str):
-            command_parts = self.dbt_command.split()
-        else:
-            command_parts = [self.dbt_command]
-        
-        command_args = command_parts + [
-            '--project-dir', self.dbt_root_dir,
-            '--profiles-dir', self.dbt_root_dir,
-        ]
-
-        if self.target:
-            command_args += ['--target', self.target]
-        
-        if self.select:
-            command_args += ['--select', self.select]
-
-        if self.full_refresh:
-            command_args.extend('--full-refresh')
-        
-        if self.dbt_vars:
-            vars_string = ' '.join([f"{key}:{value}" for key, value in self.dbt_vars.items()])
-            command_args.extend(['--vars', vars_string])
-        
+        command_args = self.build_command_args()
         self.log.info(f"Executing DBT command: {' '.join(command_args)}")
 
         res : dbtRunnerResult = self.runner.invoke(command_args)
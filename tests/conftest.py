@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Airflow puts the DAGs folder on sys.path; mirror that so `helpers` and `operators` import
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'dags'))
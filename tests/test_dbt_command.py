@@ -0,0 +1,29 @@
+import json
+
+from helpers.dbt_command import build_dbt_command_args
+
+
+def test_build_dbt_command_args_with_interval_options():
+    args = build_dbt_command_args(
+        'run --select tag:bronze',
+        '/dbt',
+        exclude='tag:full_history',
+        target_path='/dbt/target/runs/dag_pipeline_20240101T000000',
+        dbt_vars={'interval_start': '2024-01-01 00:00:00', 'interval_end': '2024-01-02 00:00:00'}
+    )
+
+    assert args[:7] == ['run', '--select', 'tag:bronze', '--project-dir', '/dbt', '--profiles-dir', '/dbt']
+    assert args[args.index('--exclude') + 1] == 'tag:full_history'
+    assert args[args.index('--target-path') + 1] == '/dbt/target/runs/dag_pipeline_20240101T000000'
+    assert json.loads(args[args.index('--vars') + 1]) == {
+        'interval_start': '2024-01-01 00:00:00', 'interval_end': '2024-01-02 00:00:00'}
+
+
+def test_build_dbt_command_args_without_options():
+    assert build_dbt_command_args('docs generate', '/dbt') == [
+        'docs', 'generate', '--project-dir', '/dbt', '--profiles-dir', '/dbt']
+
+
+def test_build_dbt_command_args_full_refresh_is_single_flag():
+    assert build_dbt_command_args('run', '/dbt', target='trino', full_refresh=True) == [
+        'run', '--project-dir', '/dbt', '--profiles-dir', '/dbt', '--target', 'trino', '--full-refresh']
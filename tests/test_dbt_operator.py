@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip('airflow')
+pytest.importorskip('dbt.cli.main')
+
+from helpers.dbt_command import build_dbt_command_args
+from operators.dbt_operator import DbtOperator
+
+
+def test_build_command_args_delegates_to_helper():
+    operator = DbtOperator(
+        task_id='transform_bronze_layer_internally',
+        dbt_root_dir='/dbt',
+        dbt_command='run --select tag:bronze',
+        exclude='tag:full_history',
+        target_path='/dbt/target/runs/dag_pipeline_20240101T000000',
+        dbt_vars={'interval_start': '2024-01-01 00:00:00', 'interval_end': '2024-01-02 00:00:00'}
+    )
+
+    assert operator.build_command_args() == build_dbt_command_args(
+        'run --select tag:bronze', '/dbt', exclude='tag:full_history',
+        target_path='/dbt/target/runs/dag_pipeline_20240101T000000',
+        dbt_vars={'interval_start': '2024-01-01 00:00:00', 'interval_end': '2024-01-02 00:00:00'})
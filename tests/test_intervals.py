@@ -0,0 +1,148 @@
+import os
+import re
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from helpers.intervals import (
+    FULL_HISTORY_TAG, SEED_INTERVAL_COLUMNS, bootstrap_tables, dbt_interval_options, interval_predicate,
+    prune_run_target_paths, run_interval, slice_interval)
+
+GENERATOR_SOURCE = open(os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'source_data_generator', 'data_generator.py')).read()
+
+
+def utc(year, month, day):
+    return datetime(year, month, day, tzinfo=timezone.utc)
+
+
+def pipeline_metadata(interval_start='2024-01-01 06:00:00', interval_end='2024-01-01 12:00:00', is_backfill=False):
+    return {
+        'pipeline_id': 'dag_pipeline_20240101T060000',
+        'interval_start': interval_start,
+        'interval_end': interval_end,
+        'is_backfill': is_backfill
+    }
+
+
+def test_interval_predicate_is_half_open():
+    assert interval_predicate('event_timestamp', '2024-01-01 06:00:00', '2024-01-01 12:00:00') == (
+        "\"event_timestamp\" >= TIMESTAMP '2024-01-01 06:00:00' "
+        "AND \"event_timestamp\" < TIMESTAMP '2024-01-01 12:00:00'")
+
+
+def test_interval_predicate_without_interval_matches_everything():
+    assert interval_predicate('event_timestamp', None, None) == 'TRUE'
+    assert interval_predicate('event_timestamp', '2024-01-01 06:00:00', None) == 'TRUE'
+
+
+@pytest.mark.parametrize('table_name', sorted(SEED_INTERVAL_COLUMNS))
+def test_seed_interval_formats_parse_generated_values(table_name):
+    column, column_format = SEED_INTERVAL_COLUMNS[table_name]
+    generator_format = re.search(rf"{column} = .*\.strftime\('([^']+)'\)", GENERATOR_SOURCE).group(1)
+    generated = datetime(2024, 3, 5, 13, 45, 10).strftime(generator_format)
+
+    parsed = datetime.strptime(generated, column_format)
+
+    assert parsed.strftime(generator_format) == generated
+
+
+def test_slice_interval_is_half_open():
+    pl = pytest.importorskip('polars')
+    lf = pl.LazyFrame({'event_timestamp': [
+        '2024-01-01 23:59:59', '2024-01-02 00:00:00', '2024-01-02 13:45:10', '2024-01-03 00:00:00']})
+
+    df = slice_interval(lf, 'event_timestamp', '%Y-%m-%d %H:%M:%S',
+                        '2024-01-02 00:00:00', '2024-01-03 00:00:00').collect()
+
+    assert df['event_timestamp'].to_list() == [datetime(2024, 1, 2), datetime(2024, 1, 2, 13, 45, 10)]
+
+
+def test_slice_interval_parses_date_only_seed_column():
+    pl = pytest.importorskip('polars')
+    lf = pl.LazyFrame({'snapshot_date': ['2024-01-01', '2024-01-02', '2024-01-03']})
+
+    df = slice_interval(lf, 'snapshot_date', '%Y-%m-%d', '2024-01-02 00:00:00', '2024-01-03 00:00:00').collect()
+
+    assert df['snapshot_date'].to_list() == [datetime(2024, 1, 2)]
+
+
+def test_slice_interval_without_interval_keeps_all_rows():
+    pl = pytest.importorskip('polars')
+    lf = pl.LazyFrame({'snapshot_date': ['2024-01-01', '2024-12-31']})
+
+    assert slice_interval(lf, 'snapshot_date', '%Y-%m-%d', None, None).collect().height == 2
+
+
+def test_run_interval_backfill_uses_exact_interval():
+    assert run_interval(utc(2024, 1, 2), utc(2024, 1, 3), utc(2023, 12, 1), is_backfill=True) == (
+        '2024-01-02 00:00:00', '2024-01-03 00:00:00')
+
+
+def test_run_interval_scheduled_catches_up_from_last_success():
+    # Scheduler was down for 2024-01-03..2024-01-05; the next run covers the gap
+    assert run_interval(utc(2024, 1, 5), utc(2024, 1, 6), utc(2024, 1, 3)) == (
+        '2024-01-03 00:00:00', '2024-01-06 00:00:00')
+
+
+def test_run_interval_scheduled_without_gap_uses_own_interval():
+    assert run_interval(utc(2024, 1, 5), utc(2024, 1, 6), utc(2024, 1, 5)) == (
+        '2024-01-05 00:00:00', '2024-01-06 00:00:00')
+
+
+def test_run_interval_first_run_loads_full_history():
+    assert run_interval(utc(2024, 1, 5), utc(2024, 1, 6), None) == (None, None)
+
+
+def test_run_interval_full_history_param_or_missing_interval():
+    assert run_interval(utc(2024, 1, 5), utc(2024, 1, 6), utc(2024, 1, 5), full_history=True) == (None, None)
+    assert run_interval(None, None, utc(2024, 1, 5)) == (None, None)
+
+
+def test_run_interval_converts_to_utc():
+    cet = timezone(timedelta(hours=1))
+    assert run_interval(datetime(2024, 1, 5, 1, tzinfo=cet), datetime(2024, 1, 6, 1, tzinfo=cet),
+                        is_backfill=True) == ('2024-01-05 00:00:00', '2024-01-06 00:00:00')
+
+
+def test_prune_run_target_paths_removes_only_expired_directories(tmp_path):
+    now = time.time()
+    for name, age_days in [('dag_pipeline_old', 4), ('dag_pipeline_recent', 1)]:
+        run_dir = tmp_path / name
+        run_dir.mkdir()
+        (run_dir / 'manifest.json').write_text('{}')
+        os.utime(run_dir, (now - age_days * 86400, now - age_days * 86400))
+
+    assert prune_run_target_paths(str(tmp_path), retention_days=3, now=now) == ['dag_pipeline_old']
+    assert sorted(os.listdir(tmp_path)) == ['dag_pipeline_recent']
+
+
+def test_prune_run_target_paths_missing_directory(tmp_path):
+    assert prune_run_target_paths(str(tmp_path / 'runs')) == []
+
+
+def test_bootstrap_tables_cover_seeds_and_bronze_models():
+    assert bootstrap_tables() == [
+        'bronze_customer_events', 'bronze_inventory_snapshots', 'bronze_payment_transactions',
+        'bronze_support_tickets', 'customer_events', 'inventory_snapshots', 'payment_transactions',
+        'support_tickets']
+
+
+def test_dbt_interval_options_scheduled_run():
+    assert dbt_interval_options(pipeline_metadata(), '/dbt') == {
+        'target_path': '/dbt/target/runs/dag_pipeline_20240101T060000',
+        'dbt_vars': {'interval_start': '2024-01-01 06:00:00', 'interval_end': '2024-01-01 12:00:00'}
+    }
+
+
+def test_dbt_interval_options_backfill_excludes_full_history_models():
+    options = dbt_interval_options(pipeline_metadata(is_backfill=True), '/dbt')
+    assert options['exclude'] == f'tag:{FULL_HISTORY_TAG}'
+    assert options['target_path'] == '/dbt/target/runs/dag_pipeline_20240101T060000'
+
+
+def test_dbt_interval_options_full_history_run_has_no_vars():
+    assert dbt_interval_options(pipeline_metadata(None, None), '/dbt') == {
+        'target_path': '/dbt/target/runs/dag_pipeline_20240101T060000'
+    }